@@ -4,12 +4,18 @@ ONE Sim Report Grouper
 
 A tool for grouping reports of ONE Simulator based on file naming conventions.
 """
+import os
 import sys
 import argparse
+import re
 import shutil
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional
 
+_FILENAME_RE = re.compile(r"^(?P<algorithm>[^-]*?)(?P<parameters>(?:-.*?)?)(?:_MessageStatsReport\.txt)?$")
+_PARAMETER_RE = re.compile(r"-([^-@]+)@([^-]*)")
+
 
 class ReportFile:
     """Represents a single report file with its metadata extracted from the filename."""
@@ -21,20 +27,14 @@ class ReportFile:
 
     def _extract_metadata(self) -> Dict[str, str]:
         """Extract metadata from the filename."""
-        # Extract the main part of the filename (before _MessageStatsReport.txt)
-        main_part = self.name.split("_MessageStatsReport.txt")[0]
-
-        # Split by hyphen to get the different sections
-        sections = main_part.split("-")
+        # Split the filename into the routing algorithm and the key@value sections
+        match = _FILENAME_RE.match(self.name)
 
         # The first section is always the routing algorithm
-        metadata = {"routingAlgorithm": sections[0]}
+        metadata = {"routingAlgorithm": match["algorithm"]}
 
         # Process the remaining sections (key@value pairs)
-        for section in sections[1:]:
-            if "@" in section:
-                key, value = section.split("@", 1)
-                metadata[key] = value
+        metadata.update(_PARAMETER_RE.findall(match["parameters"]))
 
         return metadata
 
@@ -58,10 +58,11 @@ class Grouper:
 
     def load_reports(self):
         """Load reports from the input directory."""
-        for file_path in self.input_dir.glob("*_MessageStatsReport.txt"):
-            if file_path.is_file():
-                report = ReportFile(file_path)
-                self.reports.append(report)
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith("_MessageStatsReport.txt"):
+                    report = ReportFile(Path(entry.path))
+                    self.reports.append(report)
 
         print(f"Loaded {len(self.reports)} report files.")
 
@@ -74,7 +75,7 @@ class Grouper:
         # If group_by not specified, use the last parameter in the first file as default
         if self.group_by is None:
             # Get all keys from the first report's metadata
-            keys = list(self.reports[0].metadata.keys())
+            keys = list(self.reports[0].metadata)
             # The routingAlgorithm is always first, so skip it
             keys.remove("routingAlgorithm")
             # Use the last parameter as default group_by
@@ -82,16 +83,19 @@ class Grouper:
             print(f"No group-by parameter specified. Using default: {self.group_by}")
 
         # Create a dictionary to store groups
-        groups = {}
+        groups = defaultdict(list)
 
         # Group reports by the specified parameter
+        prefix = f"{self.group_by}@"
         for report in self.reports:
             value = report.get_value(self.group_by)
             if value:
-                group_key = f"{self.group_by}@{value}"
-                if group_key not in groups:
-                    groups[group_key] = []
-                groups[group_key].append(report)
+                groups[prefix + value].append(report)
+
+        # Nothing to group when every report ends up in the same group
+        if len(groups) == 1 and len(next(iter(groups.values()))) == len(self.reports):
+            print(f"All reports share '{next(iter(groups))}', nothing to group.")
+            return
 
         # Create output directories and copy files
         for group_name, group_reports in groups.items():
@@ -100,10 +104,23 @@ class Grouper:
 
             print(f"Group '{group_name}' has {len(group_reports)} files.")
 
+            linked = copied = 0
             for report in group_reports:
                 dest_file = group_dir / report.name
-                shutil.copy2(report.path, dest_file)
-                print(f"  - Copied {report.name}")
+                if dest_file.exists() and dest_file.samefile(report.path):
+                    linked += 1
+                    continue
+
+                # Hardlink the report instead of copying its content, copy when
+                # linking is not possible (e.g. across devices)
+                try:
+                    os.link(report.path, dest_file)
+                    linked += 1
+                except OSError:
+                    shutil.copy2(report.path, dest_file)
+                    copied += 1
+
+            print(f"  - Linked {linked}, copied {copied} files")
 
 
 def parse_args():
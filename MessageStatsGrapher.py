@@ -6,36 +6,54 @@ It won't work with other report types.
 import os
 import sys
 import re
-import glob
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 from pathlib import Path
 import argparse
+import fnmatch
+import importlib.util
 import json
+import mmap
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+# pandas, numpy and matplotlib are imported inside the functions that need them,
+# so that quick invocations such as --help don't pay for their import time
+
+
+_ALGORITHM_RE = re.compile(r'^(?P<routingAlgorithm>[^-]*)')
+_PARAMETER_RE = re.compile(r'-(?P<key>[^-@]+)@(?P<value>[^-@]*)(?=-|$)')
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '\\/*?:"<>|'})
 
 
 class Config:
     """Configuration settings for the ONE Sim Report Grapher tool."""
 
     # Base directories
-    BASE_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+    BASE_DIR = Path(__file__).resolve().parent
     INPUT_DIR = BASE_DIR / "input"
     OUTPUT_DIR = BASE_DIR / "output"
 
-    # Ensure output dir exists
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
     # Graph settings
-    FIGURE_DPI = 300
+    FIGURE_DPI = 150
+    FIGURE_FORMAT = 'png'
+    # Pillow encoder options per figure format, encoding dominates the time spent saving
+    # a figure. PNG uses the fastest zlib level, the lossy formats are much cheaper.
+    SAVE_OPTIONS = {
+        'png': {'compress_level': 1},
+        'webp': {'quality': 85, 'method': 0},
+        'jpg': {'quality': 90},
+    }
+    # Solid equivalent of the default grid color at 0.7 alpha, avoids alpha blending
+    GRID_COLOR = '#c8c8c8'
+    AGG_PATH_CHUNKSIZE = 10000
     FIGURE_SIZE = (10, 6)
     LINE_STYLES = ['-', '--', '-.', ':']
     MARKERS = ['o', 's', '^', 'D', '*', 'x', '+', 'v', '<', '>']
     COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
               '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
 
-    # Metrics of interest of the report with human display names
-    METRICS = {
+    # Metrics of interest of the report with human display names (read-only)
+    METRICS = MappingProxyType({
         'created': 'Message Created',
         'started': 'Message Started',
         'relayed': 'Message Relayed',
@@ -51,7 +69,7 @@ class Config:
         'hopcount_med': 'Median Hop Count',
         'buffertime_avg': 'Average Buffer Time (s)',
         'buffertime_med': 'Median Buffer Time (s)',
-    }
+    })
 
     # Parameter display names
     PARAMETER_NAMES = {
@@ -61,116 +79,288 @@ class Config:
         'routingAlgorithm': 'Routing Algorithm'
     }
 
-    # Parameter numeric value extraction rules
+    # Parameters with few distinct values, stored as categorical columns
+    CATEGORICAL_PARAMETERS = ('routingAlgorithm', 'dropPolicy', 'forwardingStrategy', 'bufferSize')
+
+    # Report files up to this size (in bytes) are parsed without pandas
+    SMALL_REPORT_SIZE = 64 * 1024
+
+    # Parameter numeric value extraction rules, the first group of the pattern holds the digits
     NUMERIC_EXTRACTION = {
-        'bufferSize': lambda x: int(re.match(r'(\d+)', x).group(1)) if re.match(r'(\d+)', x) else x,
-        'dropPolicy': lambda x: int(x) if x.isdigit() else x
+        'bufferSize': r'^(\d+)',
+        'dropPolicy': r'^(\d+)$'
     }
 
 
-def parse_filename(filename):
+def parse_filenames(filenames):
     """
-    Parse a ONE Simulator report filename to extract configuration parameters.
+    Parse ONE Simulator report filenames to extract configuration parameters.
 
     Example filename format:
     ProphetMulti-bufferSize@1M-dropPolicy@1-forwardingStrategy@COIN_MessageStatsReport.txt
 
-    Returns a dictionary of parameters.
+    Returns a DataFrame of parameters with one row per filename.
     """
-    basename = os.path.basename(filename)
+    import pandas as pd
 
-    # Extract components
-    parts = basename.split('-')
+    basenames = pd.Series([os.path.basename(f) for f in filenames], dtype=object)
+    names = basenames.str.removesuffix('_MessageStatsReport.txt')
 
     # The first part is always the routing algorithm
-    routing_algorithm = parts[0]
-
-    # Parse the remaining parameters
-    params = {'routingAlgorithm': routing_algorithm}
-
-    for part in parts[1:]:
-        if '_MessageStatsReport.txt' in part:
-            # Handle the last part which includes the report suffix
-            key_value = part.split('_MessageStatsReport.txt')[0]
-            if '@' in key_value:
-                key, value = key_value.split('@')
-                params[key] = value
-        else:
-            # Handle regular parameter parts
-            if '@' in part:
-                key, value = part.split('@')
-                params[key] = value
-
-    # Apply numeric extraction rules
-    for key, value in list(params.items()):
-        if key in Config.NUMERIC_EXTRACTION:
-            try:
-                params[f"{key}_numeric"] = Config.NUMERIC_EXTRACTION[key](value)
-            except (ValueError, AttributeError, TypeError):
-                pass  # If conversion fails, use original
+    params = names.str.extract(_ALGORITHM_RE)
+
+    # Parse the remaining key@value parameters of every file in one pass
+    pairs = names.str.extractall(_PARAMETER_RE).droplevel('match')
+    if not pairs.empty:
+        keys = pairs['key'].unique()
+        values = pairs.set_index('key', append=True)['value']
+        values = values.groupby(level=[0, 1], sort=False).last().unstack()
+        params = params.join(values[keys])
+
+    # Apply numeric extraction rules, values that don't match keep their original value
+    for key, pattern in Config.NUMERIC_EXTRACTION.items():
+        if key in params.columns:
+            values = params[key]
+            numeric = values.str.extract(pattern, expand=False).astype('Int64')
+            if numeric.isna().sum() > values.isna().sum():
+                numeric = numeric.astype(object).where(numeric.notna(), values)
+            params[f"{key}_numeric"] = numeric
 
     return params
 
 
-def read_report_file(filename):
+def _read_small_report_file(filename):
     """
-    Read a ONE Simulator report file and extract the metric values.
+    Read a small report file through mmap, tokenizing the "key: value" lines as bytes.
 
     Returns a dictionary of metric values.
     """
     metrics = {}
 
-    with open(filename, 'r') as f:
-        lines = f.readlines()
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return metrics
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Skip the first line (header)
+            mm.readline()
+
+            for line in iter(mm.readline, b''):
+                key, sep, value = line.partition(b': ')
+                if not sep:
+                    continue
 
-        # Skip the first line (header)
-        for line in lines[1:]:
-            line = line.strip()
-            if ': ' in line:
-                key, value = line.split(': ')
+                key, value = key.strip().decode(), value.strip()
                 try:
-                    # Try to convert to float
-                    value = float(value)
-                    if value == float('nan'):
-                        value = np.nan
+                    metrics[key] = float(value)
                 except ValueError:
                     # Keep as string if not convertible
-                    pass
-                metrics[key] = value
+                    metrics[key] = value.decode()
 
     return metrics
 
 
+def read_report_file(filename):
+    """
+    Read a ONE Simulator report file and extract the metric values.
+
+    Report files are usually tiny, for those the fixed cost of pandas' CSV reader
+    dominates, so they are parsed directly. Larger files go through pandas.
+
+    Returns a dictionary of metric values.
+    """
+    if os.path.getsize(filename) <= Config.SMALL_REPORT_SIZE:
+        return _read_small_report_file(filename)
+
+    import pandas as pd
+
+    # Skip the first line (header), the rest are "key: value" pairs
+    report = pd.read_csv(filename, sep=':', skiprows=1, header=None, names=['key', 'value'],
+                         index_col='key', skipinitialspace=True, on_bad_lines='skip')
+    values = report['value']
+
+    # Keep values as string if not convertible to float
+    if not pd.api.types.is_numeric_dtype(values):
+        numeric = pd.to_numeric(values, errors='coerce')
+        values = numeric.where(numeric.notna() | values.isna(), values)
+
+    return values.to_dict()
+
+
+def build_metrics_frame(reports):
+    """
+    Build a DataFrame from the metric dictionaries of several report files.
+
+    All metrics are written into a single C-contiguous float64 block, a metric only
+    falls back to an object column when it holds a value that is not convertible to float.
+
+    Returns a DataFrame with one row per report.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # Metric columns in the order they are first seen
+    keys = list(dict.fromkeys(key for metrics in reports for key in metrics))
+    key_index = {key: j for j, key in enumerate(keys)}
+
+    block = np.full((len(reports), len(keys)), np.nan, dtype=np.float64)
+    objects = {}
+
+    for i, metrics in enumerate(reports):
+        for key, value in metrics.items():
+            column = objects.get(key)
+            if column is None:
+                try:
+                    block[i, key_index[key]] = value
+                    continue
+                except (ValueError, TypeError):
+                    column = objects[key] = block[:, key_index[key]].astype(object)
+            column[i] = value
+
+    df = pd.DataFrame(block, columns=keys, index=pd.RangeIndex(len(reports)), copy=False)
+    for key, column in objects.items():
+        df[key] = column
+
+    return df
+
+
+def find_report_files(directory, pattern="*_MessageStatsReport.txt"):
+    """
+    Find the report files in a directory. Uses os.scandir, the entries' names and
+    file types come from the directory listing without an extra stat per entry.
+
+    Returns a list of paths of the matching files.
+    """
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries
+                if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()]
+
+
 def collect_data(input_dir):
     """
     Collect data from all report files in the input directory.
 
     Returns a pandas DataFrame with all metrics and parameters.
     """
-    data = []
+    import pandas as pd
 
     # Find all report files
-    pattern = os.path.join(input_dir, "*_MessageStatsReport.txt")
-    files = glob.glob(pattern)
+    files = find_report_files(input_dir)
 
-    for file in files:
-        # Parse filename to get parameters
-        params = parse_filename(file)
+    # Parse all filenames at once to get parameters
+    params = parse_filenames(files)
 
-        # Read report file to get metrics
-        metrics = read_report_file(file)
+    # Read report files concurrently to get metrics, the reads are I/O bound
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        metrics = build_metrics_frame(list(executor.map(read_report_file, files)))
 
-        # Combine parameters and metrics
-        row = {**params, **metrics}
-        data.append(row)
+    # Combine parameters and metrics
+    df = pd.concat([params, metrics], axis=1)
 
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
+    # Low cardinality parameters are stored as categories, comparisons and grouping
+    # then work on small integer codes instead of strings
+    for col in Config.CATEGORICAL_PARAMETERS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
 
     return df
 
 
-def plot_comparison(df, metrics, x_axis, compare_by, output_dir, config):
+def sanitize_filename(name):
+    """Replace the characters that are not allowed in filenames with underscores."""
+    return name.translate(_FILENAME_TABLE)
+
+
+def _plot_values(series):
+    """Convert a Series to a NumPy array for plotting, numeric data as float64 with NaN for missing values."""
+    import numpy as np
+    import pandas as pd
+
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy()
+
+
+def _render_figures(task):
+    """
+    Render the figures of several metrics that share the same comparison lines.
+    Runs in-process or inside a worker process, so everything it needs is in the task.
+
+    :param task: Dictionary with the config, the x-axis label, the comparison
+        series and the plots (metric index, labels and output file) to render
+    :return: List of the saved output files
+    """
+    import matplotlib
+    import numpy as np
+    from matplotlib.figure import Figure
+
+    config = task['config']
+    matplotlib.rcParams['agg.path.chunksize'] = config.AGG_PATH_CHUNKSIZE
+
+    # Line styles of every comparison line, works by cycling through styles/markers/colors
+    series = task['series']
+    styles = [
+        (config.LINE_STYLES[i % len(config.LINE_STYLES)],
+         config.MARKERS[i % len(config.MARKERS)],
+         config.COLORS[i % len(config.COLORS)])
+        for i in range(len(series))
+    ]
+
+    # A single figure is reused for every metric, its constrained layout fits the
+    # labels without the extra render pass of bbox_inches='tight'. The figure is
+    # created without pyplot, so no global figure manager or backend is involved.
+    fig = Figure(figsize=config.FIGURE_SIZE, layout='constrained')
+    ax = fig.subplots()
+    saved = []
+
+    # The axes chrome and the comparison lines are created once, every metric only
+    # swaps the data of the lines. The lines start with their x values and no valid
+    # y values, so the x-axis knows all values (and categories) up front.
+    lines = []
+    for (label, x_values, _, _), (linestyle, marker, color) in zip(series, styles):
+        line, = ax.plot(
+            x_values,
+            np.full(len(x_values), np.nan),
+            linestyle=linestyle,
+            marker=marker,
+            color=color,
+            label=label
+        )
+        # Only the data lines need pixels, keeps axes and labels as vectors in PDF/SVG
+        line.set_rasterized(True)
+        lines.append(line)
+
+    ax.set_xlabel(task['x_label'])
+    ax.grid(True, linestyle='--', color=config.GRID_COLOR)
+
+    for plot in task['plots']:
+        metric_idx = plot['metric_idx']
+
+        # Update each comparison line
+        visible_lines = []
+        for line, (_, x_values, y_block, valid_block) in zip(lines, series):
+            # Leave out missing points, hide the line if it has none
+            valid = valid_block[:, metric_idx]
+            line.set_visible(bool(valid.any()))
+            if line.get_visible():
+                line.set_data(x_values[valid], y_block[valid, metric_idx])
+                visible_lines.append(line)
+
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
+
+        # Set labels and title
+        ax.set_ylabel(plot['y_label'])
+        ax.set_title(plot['title'])
+        ax.legend(handles=visible_lines, loc='best')
+
+        fig.savefig(plot['output_file'], dpi=config.FIGURE_DPI, pil_kwargs=config.SAVE_OPTIONS.get(task['fig_format']))
+        saved.append(plot['output_file'])
+
+    return saved
+
+
+def plot_comparison(df, metrics, x_axis, compare_by, output_dir, config, jobs=1, fig_format=None):
     """
     Create line graphs comparing the specified parameter across different values
     for each metric.
@@ -181,64 +371,64 @@ def plot_comparison(df, metrics, x_axis, compare_by, output_dir, config):
     :param compare_by: Parameter to compare (line series)
     :param output_dir: Directory to save the output
     :param config: Configuration object
+    :param jobs: Number of processes rendering the figures
+    :param fig_format: Image format of the figures, defaults to config.FIGURE_FORMAT
     """
+    import numpy as np
+    import pandas as pd
+
+    fig_format = fig_format or config.FIGURE_FORMAT
+
     # Ensure the x_axis has a numeric version
     if f"{x_axis}_numeric" in df.columns:
         x_axis_numeric = f"{x_axis}_numeric"
     else:
         x_axis_numeric = x_axis
 
-    # Get unique values for the comparison parameter
-    compare_values = df[compare_by].unique()
-    compare_values = sorted(compare_values)
-
-    # Create graphs for each metric
+    # Only numeric metrics can be plotted, their column in the per-group blocks below
+    plot_metrics = []
     for metric in metrics:
         if metric not in df.columns:
             print(f"Warning: Metric '{metric}' not found in data. Skipping.")
+        elif not pd.api.types.is_numeric_dtype(df[metric]):
+            print(f"Warning: Metric '{metric}' is not numeric. Skipping.")
+        else:
+            plot_metrics.append(metric)
+
+    compare_name = config.PARAMETER_NAMES.get(compare_by, compare_by)
+
+    # Sort once by the comparison parameter and the x-axis, so every group of
+    # the comparison parameter is already sorted by its x-axis value. The x values,
+    # a (points, metrics) block of y values and its mask of valid (finite) points
+    # are extracted once per group.
+    df_sorted = df.sort_values([compare_by, x_axis_numeric], kind='stable')
+    series = []
+    for value, group in df_sorted.groupby(compare_by, sort=False):
+        y_block = group[plot_metrics].to_numpy(dtype=np.float64, na_value=np.nan)
+        series.append((f'{compare_name} {value}', _plot_values(group[x_axis_numeric]), y_block, np.isfinite(y_block)))
+
+    # Whether a metric has at least one valid point in any group
+    metric_has_data = np.zeros(len(plot_metrics), dtype=bool)
+    for _, _, _, valid_block in series:
+        metric_has_data |= valid_block.any(axis=0)
+
+    # Get all other consistent parameters for the title, computed once for every metric
+    excluded = {x_axis, compare_by, x_axis_numeric} | {c for c in df.columns if c.endswith("_numeric")}
+    unique_counts = df.drop(columns=list(excluded & set(df.columns))).nunique(dropna=False)
+    constant_columns = unique_counts.index[unique_counts == 1]
+    all_constant_params = {col: df[col].iloc[0] for col in constant_columns}
+
+    x_label = config.PARAMETER_NAMES.get(x_axis, x_axis)
+
+    # Describe the graph of each metric
+    plots = []
+    for metric_idx, metric in enumerate(plot_metrics):
+        if not metric_has_data[metric_idx]:
+            print(f"Warning: Metric '{metric}' has no data. Skipping.")
             continue
 
-        plt.figure(figsize=config.FIGURE_SIZE)
-
-        # Get all other consistent parameters for the title
-        constant_params = {}
-        for col in df.columns:
-            if col not in [x_axis, compare_by, metric, x_axis_numeric] and col not in [f"{p}_numeric" for p in df.columns]:
-                if len(df[col].unique()) == 1:
-                    constant_params[col] = df[col].iloc[0]
-
-        # Plot each comparison line
-        for i, value in enumerate(compare_values):
-            # Filter data for this comparison value
-            filtered_df = df[df[compare_by] == value].copy()
-
-            # Skip if no data
-            if filtered_df.empty:
-                continue
-
-            # Sort by x-axis value
-            filtered_df = filtered_df.sort_values(x_axis_numeric)
-
-            # Plot line, works by cycling through styles/colors/markers
-            style_idx = i % len(config.LINE_STYLES)
-            color_idx = i % len(config.COLORS)
-            marker_idx = i % len(config.MARKERS)
-
-            plt.plot(
-                filtered_df[x_axis_numeric],
-                filtered_df[metric],
-                linestyle=config.LINE_STYLES[style_idx],
-                marker=config.MARKERS[marker_idx],
-                color=config.COLORS[color_idx],
-                label=f'{config.PARAMETER_NAMES.get(compare_by, compare_by)} {value}'
-            )
-
-        # Set labels and title
-        x_label = config.PARAMETER_NAMES.get(x_axis, x_axis)
-        plt.xlabel(f'{x_label}')
-
+        constant_params = {k: v for k, v in all_constant_params.items() if k != metric}
         metric_label = config.METRICS.get(metric, metric)
-        plt.ylabel(metric_label)
 
         # # Create a title with constant parameters
         # const_params_str = ", ".join([f"{config.PARAMETER_NAMES.get(k, k)}: {v}" for k, v in constant_params.items()])
@@ -247,44 +437,76 @@ def plot_comparison(df, metrics, x_axis, compare_by, output_dir, config):
 
         # plt.title(f'{metric_label} vs {x_label} by {config.PARAMETER_NAMES.get(compare_by, compare_by)}{const_params_str}')
 
-        plt.title(
-            f'{metric_label} vs {x_label} by {config.PARAMETER_NAMES.get(compare_by, compare_by)} using {constant_params.get("routingAlgorithm")}')
+        title = f'{metric_label} vs {x_label} by {compare_name} using {constant_params.get("routingAlgorithm")}'
 
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-
-        # Replacing slashes in the filename to avoid issues
-        safe_compare_by = compare_by.replace("/", "_")
-        safe_x_axis = x_axis.replace("/", "_")
-        safe_metric = metric.replace("/", "_")
+        # Replacing slashes and other reserved characters in the filename to avoid issues
+        safe_compare_by = sanitize_filename(compare_by)
+        safe_x_axis = sanitize_filename(x_axis)
+        safe_metric = sanitize_filename(metric)
 
         # I'll customize the file naming for simplicity sake
         # FILENAMING = f"compare_{safe_compare_by}_by_{safe_x_axis}_{safe_metric}.png"
-        FILENAMING = f"{Path(output_dir).name}_{safe_metric}.png"
+        FILENAMING = f"{Path(output_dir).name}_{safe_metric}.{fig_format}"
 
         output_file = os.path.join(
             output_dir,
             FILENAMING
         )
-        plt.savefig(output_file, dpi=config.FIGURE_DPI, bbox_inches='tight')
-        plt.close()
+        plots.append({
+            'metric_idx': metric_idx,
+            'y_label': metric_label,
+            'title': title,
+            'output_file': output_file,
+        })
+
+    if not plots:
+        return
+
+    # Split the plots between the processes, each renders its share on one figure
+    jobs = max(1, min(jobs, len(plots)))
+    tasks = [
+        {'config': config, 'fig_format': fig_format, 'x_label': x_label, 'series': series, 'plots': plots[i::jobs]}
+        for i in range(jobs)
+    ]
+
+    if jobs == 1:
+        results = map(_render_figures, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.get_context('spawn').Pool(processes=jobs)
+        results = pool.imap(_render_figures, tasks)
 
-        print(f"Saved {output_file}")
+    try:
+        for saved in results:
+            for output_file in saved:
+                print(f"Saved {output_file}")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
 
-def save_data_summary(df, output_dir):
+def save_data_summary(df, output_dir, data_format='csv'):
     """
-    Save a summary of the data for reference. Saved as CSV and JSON.
+    Save a summary of the data for reference. The complete dataset is saved as CSV
+    or Parquet, the summary as JSON.
 
     Args:
         df: DataFrame with the data
         output_dir: Directory to save the output
+        data_format: Format of the complete dataset, either 'csv' or 'parquet'
     """
+    import pandas as pd
+
     dir_name = os.path.basename(os.path.normpath(output_dir))
-    csv_file = f"{dir_name}_all_data.csv" if dir_name else "all_data.csv"
-    csv_path = os.path.join(output_dir, csv_file)
-    df.to_csv(csv_path, index=False)
-    print(f"Saved complete dataset to {csv_path}")
+    data_file = f"{dir_name}_all_data.{data_format}" if dir_name else f"all_data.{data_format}"
+    data_path = os.path.join(output_dir, data_file)
+    if data_format == 'parquet':
+        # Columnar binary, avoids formatting every value as text
+        df.to_parquet(data_path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        df.to_csv(data_path, index=False)
+    print(f"Saved complete dataset to {data_path}")
 
     # Save a JSON with parameter and metric information
     info = {
@@ -297,26 +519,29 @@ def save_data_summary(df, output_dir):
         if col in Config.METRICS or col.endswith("_numeric"):
             continue
 
-        values = df[col].unique().tolist()
+        values = df[col].drop_duplicates()
         try:
-            values = sorted(values)
+            values = values.sort_values()
         except TypeError:
             pass  # Can't sort mixed types
 
         info["parameters"][col] = {
-            "unique_values": values,
+            "unique_values": values.tolist(),
             "count": len(values)
         }
 
     # Get metric information (summary statistics) that will be represented in JSON.
-    for metric in Config.METRICS.keys():
-        if metric in df.columns:
-            info["metrics"][metric] = {
-                "min": float(df[metric].min()) if not df[metric].isna().all() else None,
-                "max": float(df[metric].max()) if not df[metric].isna().all() else None,
-                "mean": float(df[metric].mean()) if not df[metric].isna().all() else None,
-                "has_nan": bool(df[metric].isna().any())
-            }
+    # The statistics of all metrics are aggregated in a single pass, they are only
+    # NaN when the whole column is NaN.
+    metric_cols = [metric for metric in Config.METRICS if metric in df.columns]
+    stats = df[metric_cols].agg(['min', 'max', 'mean'])
+    has_nan = df[metric_cols].isna().any()
+    for metric in metric_cols:
+        info["metrics"][metric] = {
+            stat: None if pd.isna(value) else float(value)
+            for stat, value in stats[metric].items()
+        }
+        info["metrics"][metric]["has_nan"] = bool(has_nan[metric])
 
     # Save the summary
     json_file = f"{dir_name}_data_summary.json" if dir_name else "data_summary.json"
@@ -340,9 +565,19 @@ def main():
                         help='Parameter to compare (create separate lines for each value)')
     parser.add_argument('--metrics', '-m', type=str, nargs='+',
                         help='Selected metrics to plot (default: all)')
+    parser.add_argument('--summary', '-s', type=str, default='csv', choices=['csv', 'parquet', 'none'],
+                        help='Format of the saved dataset and summary, "none" skips it (default: csv)')
+    parser.add_argument('--format', '-f', type=str, default=Config.FIGURE_FORMAT, choices=list(Config.SAVE_OPTIONS),
+                        help=f'Image format of the graphs (default: {Config.FIGURE_FORMAT})')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes rendering the graphs (default: number of CPUs)')
 
     args = parser.parse_args()
 
+    if args.summary == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        print("Error: Saving the summary as parquet requires pyarrow to be installed.")
+        return 1
+
     # Initialize configuration
     config = Config()
 
@@ -363,14 +598,15 @@ def main():
     df = collect_data(input_dir)
 
     # Save data summary
-    save_data_summary(df, output_dir)
+    if args.summary != 'none':
+        save_data_summary(df, output_dir, args.summary)
 
-    # Filter metrics if specified
-    metrics_to_plot = args.metrics if args.metrics else config.METRICS.keys()
+    # Filter metrics if specified, duplicates would render the same figure twice
+    metrics_to_plot = list(dict.fromkeys(args.metrics)) if args.metrics else list(config.METRICS)
 
     # Create comparison graphs
     print(f"Creating comparison graphs with {args.x_axis} on x-axis and {args.compare_by} for comparison...")
-    plot_comparison(df, metrics_to_plot, args.x_axis, args.compare_by, output_dir, config)
+    plot_comparison(df, metrics_to_plot, args.x_axis, args.compare_by, output_dir, config, args.jobs, args.format)
 
     print("Done!")
 